@@ -1,10 +1,24 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext, ttk
+from tkinter import filedialog, font as tkfont, messagebox, scrolledtext, ttk
+import collections
+import contextlib
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed, CancelledError
+import functools
+import hashlib
+import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
+import re
 import json
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import orjson  # optional: much faster JSON parsing, used when installed
+except ImportError:
+    orjson = None
 import time
 import shutil
 from datetime import datetime, timedelta, timezone
@@ -46,31 +60,123 @@ CHAR_LIMIT = DEFAULT_CONFIG["char_limit"]
 VOICE_SETTINGS = dict(DEFAULT_CONFIG["voice_settings"])
 UPDATE_INTERVAL_DAYS = DEFAULT_CONFIG["update_interval_days"]
 
-# single lock to guard shared runtime state and related file writes
+# cap on how much of a picked .txt file is loaded into the GUI
+MAX_INPUT_CHARS = 5 * 1024 * 1024
+
+# lock guarding the in-memory key/usage state (held only for dict work)
 state_lock = threading.RLock()
+# separate lock serializing the atomic file writes, so persisting never
+# blocks threads that only touch the in-memory state
+_persist_lock = threading.Lock()
 
 # In-memory state
 API_KEYS = []  # list of keys
 key_usage = {}  # count of chunks used per key (optional)
 char_usage = {}  # total characters sent per key
-first_used = {}  # ISO date when key first used
+first_used = {}  # unix timestamp (UTC) of key's first use; ISO strings on disk
 invalid_keys = set()  # keys exceeding quota
-current_key_index = 0
+# rotating deque of currently-usable keys; rebuilt whenever key state changes
+_valid_keys = collections.deque()
+
+# Batched state persistence: flush every N dirty chunks or T seconds,
+# whichever comes first, instead of after every single chunk
+SAVE_EVERY_N_CHUNKS = 10
+SAVE_EVERY_SEC = 30.0
+_dirty_since_save = 0
+_last_save_ts = time.monotonic()
+
+# Per-key rate limiting: minimum seconds between requests on the same key.
+# Key rotation spreads load, so only the residual wait (if any) is slept.
+PER_KEY_MIN_INTERVAL = 3.0
+_key_next_send = {}  # key -> earliest monotonic time the next send may start
+
+# upper bound on concurrent TTS requests regardless of how many keys exist
+MAX_PARALLEL_CHUNKS = 4
+
+# Shared HTTP session: keep-alive avoids a TCP+TLS handshake per chunk,
+# and the adapter pools enough connections for parallel key dispatch.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504])
+))
+# every request we make is JSON; set the header once instead of per call
+SESSION.headers.update({"Content-Type": "application/json"})
+
+
+# === Logging ===
+class _GuiLogHandler(logging.Handler):
+    """Puts formatted records on the App's message queue and wakes the
+       mainloop, so backend output reaches the log box without redirecting
+       sys.stdout/stderr through a per-write shim."""
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self.app.queue.append(msg + "\n")
+        try:
+            # event_generate is thread-safe; poll_queue drains on the UI thread
+            self.app.root.event_generate("<<LogMessage>>", when="tail")
+        except tk.TclError:
+            pass
+
+
+# Worker threads only enqueue records (no I/O, no stream lock); a single
+# listener thread formats and writes them out. Until the App swaps in the
+# GUI handler, records go to stderr.
+_log_queue = queue.SimpleQueue()
+log = logging.getLogger("aiverse_tts")
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+
+
+def _loads(data):
+    """Parse JSON bytes/str with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_compact(obj):
+    """Serialize to compact JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _dumps_pretty(obj):
+    """Serialize to indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
 
 
 # Load/Save Config
 def load_config():
     """Load config.json or create it with defaults. Updates global vars."""
     global CHAR_LIMIT, VOICE_SETTINGS, UPDATE_INTERVAL_DAYS
-    if not os.path.exists(CONFIG_FILE):
+    try:
+        with open(CONFIG_FILE, 'rb') as f:
+            cfg = _loads(f.read())
+    except FileNotFoundError:
+        # first launch: bootstrap the file with defaults
+        cfg = DEFAULT_CONFIG.copy()
         try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(DEFAULT_CONFIG, f, indent=2)
+            atomic_write_json(CONFIG_FILE, DEFAULT_CONFIG)
         except Exception:
             pass
-    try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            cfg = json.load(f)
     except Exception:
         cfg = DEFAULT_CONFIG.copy()
 
@@ -98,12 +204,23 @@ def load_config():
     return cfg
 
 
-def atomic_write_json(path, obj):
-    """Write JSON atomically: write to tmp file then replace."""
+def atomic_write_json(path, obj, compact=False):
+    """Write JSON atomically: serialize to one bytes buffer, single write to
+       a tmp file, fsync, then replace. json.dump's many small writes are
+       avoided and the rename never publishes an un-synced file.
+       compact=True drops indentation for files no human ever edits."""
+    atomic_write_bytes(path, _dumps_compact(obj) if compact else _dumps_pretty(obj))
+
+
+def atomic_write_bytes(path, data):
+    """Atomically write pre-serialized bytes (tmp file + fsync + replace)."""
     tmp = path + ".tmp"
     try:
-        with open(tmp, 'w', encoding='utf-8') as f:
-            json.dump(obj, f, indent=2)
+        # unbuffered: the payload goes out in exactly one write, so the
+        # BufferedWriter layer would only add a copy
+        with open(tmp, 'wb', buffering=0) as f:
+            f.write(data)
+            os.fsync(f.fileno())
         os.replace(tmp, path)
     except Exception as e:
         # best-effort cleanup
@@ -115,8 +232,15 @@ def atomic_write_json(path, obj):
         raise
 
 
+# hashes of the last payloads written; skip writes when content is unchanged
+_last_config_hash = None
+_last_keys_hash = None
+
+
 def save_config(cfg=None):
-    """Persist current config (cfg dict optional). Thread-safe and atomic."""
+    """Persist current config (cfg dict optional). Thread-safe and atomic.
+       No-ops when the serialized config matches the last write."""
+    global _last_config_hash
     if cfg is None:
         cfg = {
             "char_limit": CHAR_LIMIT,
@@ -124,23 +248,41 @@ def save_config(cfg=None):
             "update_interval_days": UPDATE_INTERVAL_DAYS,
             "theme": getattr(save_config, '_current_theme', 'light')
         }
+    data = _dumps_pretty(cfg)
+    h = hashlib.blake2b(data, digest_size=16).digest()
     try:
-        with state_lock:
-            atomic_write_json(CONFIG_FILE, cfg)
+        with _persist_lock:
+            if h == _last_config_hash:
+                return
+            atomic_write_bytes(CONFIG_FILE, data)
+            _last_config_hash = h
     except Exception as e:
-        print("Could not save config:", e)
+        log.error("Could not save config: %s", e)
 
 
 # === Voice Cache Helpers ===
+# mtime-keyed memo so repeated get_voices() calls don't re-parse the file
+_voice_cache_memo = {"mtime": None, "data": None}
+
+
 def load_voice_cache():
-    """Return cached data dict or None if missing/corrupt."""
-    if not os.path.exists(VOICE_CACHE_FILE):
+    """Return cached data dict or None if missing/corrupt. The parsed dict
+       is memoized against the file's mtime, so unchanged files cost one
+       stat instead of a full read + parse."""
+    try:
+        mtime = os.stat(VOICE_CACHE_FILE).st_mtime_ns
+    except OSError:
         return None
+    if mtime == _voice_cache_memo["mtime"]:
+        return _voice_cache_memo["data"]
     try:
-        with open(VOICE_CACHE_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(VOICE_CACHE_FILE, 'rb') as f:
+            data = _loads(f.read())
     except Exception:
         return None
+    _voice_cache_memo["mtime"] = mtime
+    _voice_cache_memo["data"] = data
+    return data
 
 
 def save_voice_cache(voices):
@@ -150,10 +292,13 @@ def save_voice_cache(voices):
         "voices": voices
     }
     try:
-        with state_lock:
-            atomic_write_json(VOICE_CACHE_FILE, payload)
+        with _persist_lock:
+            atomic_write_json(VOICE_CACHE_FILE, payload, compact=True)
+            # keep the memo in sync with what was just written
+            _voice_cache_memo["mtime"] = os.stat(VOICE_CACHE_FILE).st_mtime_ns
+            _voice_cache_memo["data"] = payload
     except Exception as e:
-        print("Could not write voice cache:", e)
+        log.error("Could not write voice cache: %s", e)
 
 
 def fetch_voices_from_api(timeout=30):
@@ -166,7 +311,7 @@ def fetch_voices_from_api(timeout=30):
 
     for k in keys_snapshot:
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 "https://api.elevenlabs.io/v1/voices",
                 headers={"xi-api-key": k},
                 timeout=timeout
@@ -175,97 +320,157 @@ def fetch_voices_from_api(timeout=30):
                 return resp.json().get("voices", [])
             elif resp.status_code in (401, 403):
                 with state_lock:
-                    invalid_keys.add(k)
+                    _invalidate_key_locked(k)
         except requests.RequestException:
             continue
     return None
 
 
-def get_voices(use_cache=True, force_refresh=False):
-    """Return list of voices. Use cache if fresh (age < UPDATE_INTERVAL_DAYS) unless forced."""
-    # load cache
-    cache = load_voice_cache()
-    if use_cache and cache and not force_refresh:
-        try:
-            fetched_at = datetime.fromisoformat(cache.get("fetched_at"))
-            if fetched_at.tzinfo is None:
-                fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+def _refresh_voices_async(on_refresh=None):
+    """Revalidate the voice cache from the API on a background thread.
+       Calls on_refresh(voices) if a fresh list was fetched."""
+    def worker():
+        voices = fetch_voices_from_api()
+        if voices:
+            save_voice_cache(voices)
+            if on_refresh:
+                on_refresh(voices)
+    threading.Thread(target=worker, daemon=True).start()
 
-            if (datetime.now(timezone.utc) - fetched_at) < timedelta(days=UPDATE_INTERVAL_DAYS):
-                return cache.get("voices", [])
-        except Exception:
-            # if timestamp parse fails, ignore cache
-            pass
 
-    # cache is stale or force refresh → try to fetch
+def _voice_cache_stale(cache):
+    """True when the cached voice list is older than UPDATE_INTERVAL_DAYS.
+       An unparseable timestamp counts as stale."""
+    try:
+        fetched_at = datetime.fromisoformat(cache.get("fetched_at"))
+        if fetched_at.tzinfo is None:
+            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - fetched_at) >= timedelta(days=UPDATE_INTERVAL_DAYS)
+    except Exception:
+        return True
+
+
+def get_voices(use_cache=True, force_refresh=False, on_refresh=None):
+    """Return list of voices. A cached list (even a stale one) is returned
+       immediately; when it is older than UPDATE_INTERVAL_DAYS or a refresh
+       is forced, revalidation happens in the background and on_refresh is
+       invoked with the fresh list. Only a missing cache blocks on the API."""
+    cache = load_voice_cache() if use_cache else None
+    if cache:
+        if force_refresh or _voice_cache_stale(cache):
+            _refresh_voices_async(on_refresh)
+        return cache.get("voices", [])
+
+    # no cache at all → fetch synchronously
     voices = fetch_voices_from_api()
     if voices:
         save_voice_cache(voices)
         return voices
 
-    # fallback to cache even if stale
-    if cache:
-        return cache.get("voices", [])
-
     # ultimate fallback: empty list
     return []
 
 
 # === Persistence Helpers ===
+# set once load_keys()/load_state() have run; lets process_text skip re-reading
+# the files on every invocation
+_state_loaded = False
+
+
+def ensure_state_loaded():
+    """Defensive one-time load of keys + state for library-style callers.
+       The __main__ block already loads at startup, making this a no-op."""
+    with state_lock:
+        if _state_loaded:
+            return
+    load_keys()
+    load_state()
+
+
 def load_keys():
     """Load or initialize API_KEYS from external file."""
     global API_KEYS, key_usage, char_usage, first_used, invalid_keys
     with state_lock:
-        # Ensure key file exists
-        if not os.path.exists(KEY_FILE):
-            atomic_write_json(KEY_FILE, DEFAULT_API_KEYS)
-        # Load keys
         try:
-            with open(KEY_FILE, 'r', encoding='utf-8') as f:
-                API_KEYS = json.load(f)
+            with open(KEY_FILE, 'rb') as f:
+                API_KEYS = _loads(f.read())
+        except FileNotFoundError:
+            # first launch: initialize the key file
+            API_KEYS = DEFAULT_API_KEYS.copy()
+            try:
+                atomic_write_json(KEY_FILE, DEFAULT_API_KEYS)
+            except Exception as e:
+                log.error("Could not create key file: %s", e)
         except Exception:
             API_KEYS = DEFAULT_API_KEYS.copy()
         # Initialize usage dicts for new keys
         for k in API_KEYS:
             key_usage.setdefault(k, 0)
             char_usage.setdefault(k, 0)
+        _rebuild_valid_keys_locked()
 
 
 def save_keys():
-    """Persist the list of API_KEYS to external file."""
+    """Persist the list of API_KEYS to external file.
+       No-ops when the serialized list matches the last write."""
+    global _last_keys_hash
     with state_lock:
+        keys_snapshot = list(API_KEYS)
+    data = _dumps_pretty(keys_snapshot)
+    h = hashlib.blake2b(data, digest_size=16).digest()
+    with _persist_lock:
+        if h == _last_keys_hash:
+            return
         try:
-            atomic_write_json(KEY_FILE, API_KEYS)
+            atomic_write_bytes(KEY_FILE, data)
+            _last_keys_hash = h
         except Exception as e:
-            print("Could not save keys:", e)
+            log.error("Could not save keys: %s", e)
+
+
+def _parse_first_used(raw):
+    """Parse {key: iso_string} into {key: unix_ts}. Files we wrote always
+       hold tz-aware ISO strings, so the whole dict is converted in one
+       comprehension; only if that fails does the per-entry fallback run,
+       salvaging valid entries and skipping malformed ones."""
+    try:
+        parsed = {k: datetime.fromisoformat(ts) for k, ts in raw.items()}
+        if all(dt.tzinfo is not None for dt in parsed.values()):
+            return {k: dt.timestamp() for k, dt in parsed.items()}
+    except (ValueError, TypeError):
+        pass
+    out = {}
+    for k, ts in raw.items():
+        try:
+            dt = datetime.fromisoformat(ts)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            out[k] = dt.timestamp()
+        except Exception:
+            pass
+    return out
 
 
 def load_state():
     """Load key_usage, char_usage, first_used, invalid_keys; reset quotas >31 days old."""
-    global key_usage, char_usage, first_used, invalid_keys
+    global key_usage, char_usage, first_used, invalid_keys, _state_loaded
     with state_lock:
-        if os.path.exists(STATE_FILE):
-            try:
-                with open(STATE_FILE, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-                key_usage.update(state.get('key_usage', {}))
-                char_usage.update(state.get('char_usage', {}))
-                for k, ts in state.get('first_used', {}).items():
-                    try:
-                        dt = datetime.fromisoformat(ts)
-                        if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=timezone.utc)
-                        first_used[k] = dt
-                    except Exception:
-                        pass
-                invalid_keys = set(state.get('invalid_keys', []))
-            except Exception:
-                print("Warning: could not load key state; starting fresh.")
-                key_usage.clear()
-                char_usage.clear()
-                first_used.clear()
-                invalid_keys.clear()
-        else:
+        _state_loaded = True
+        try:
+            with open(STATE_FILE, 'rb') as f:
+                state = _loads(f.read())
+            key_usage.update(state.get('key_usage', {}))
+            char_usage.update(state.get('char_usage', {}))
+            first_used.update(_parse_first_used(state.get('first_used', {})))
+            invalid_keys = set(state.get('invalid_keys', []))
+            _rebuild_valid_keys_locked()
+        except FileNotFoundError:
+            key_usage.clear()
+            char_usage.clear()
+            first_used.clear()
+            invalid_keys.clear()
+        except Exception:
+            log.warning("Could not load key state; starting fresh.")
             key_usage.clear()
             char_usage.clear()
             first_used.clear()
@@ -275,24 +480,113 @@ def load_state():
     reset_expired_keys()
 
 
-def _save_state_locked():
-    """Write state to disk. Assumes state_lock is already held."""
-    payload = {
-        'key_usage': key_usage,
-        'char_usage': char_usage,
-        'first_used': {k: dt.isoformat() for k, dt in first_used.items()},
+# cache of first_used ISO strings keyed by api key: {key: (ts, iso)}.
+# Entries are set once per 31-day window, so the formatted string can be
+# reused across snapshots instead of calling isoformat() per key per save.
+_first_used_iso = {}
+
+
+def _first_used_iso_locked():
+    """Return {key: iso_string} for first_used, reusing cached strings for
+       timestamps that haven't changed. Assumes state_lock is held."""
+    out = {}
+    for k, ts in first_used.items():
+        cached = _first_used_iso.get(k)
+        if cached is None or cached[0] != ts:
+            iso = datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+            _first_used_iso[k] = (ts, iso)
+        else:
+            iso = cached[1]
+        out[k] = iso
+    # drop strings for keys that were reset/removed
+    if len(_first_used_iso) > len(first_used):
+        for k in list(_first_used_iso):
+            if k not in first_used:
+                del _first_used_iso[k]
+    return out
+
+
+def _snapshot_state_locked():
+    """Build a plain-dict snapshot of the state. Assumes state_lock is held."""
+    return {
+        'key_usage': dict(key_usage),
+        'char_usage': dict(char_usage),
+        'first_used': _first_used_iso_locked(),
         'invalid_keys': list(invalid_keys)
     }
-    atomic_write_json(STATE_FILE, payload)
+
+
+# hash of the last state payload written; lets _persist_state skip no-op writes
+_last_state_hash = None
+
+
+def _persist_state(payload):
+    """Serialize and atomically write a snapshot. Runs without state_lock so
+       other threads aren't blocked behind the disk write. Skips the write
+       entirely when the payload is byte-identical to the last one saved."""
+    global _last_state_hash
+    data = _dumps_compact(payload)
+    h = hashlib.blake2b(data, digest_size=16).digest()
+    with _persist_lock:
+        if h == _last_state_hash:
+            return
+        atomic_write_bytes(STATE_FILE, data)
+        _last_state_hash = h
 
 
 def save_state():
-    """Thread-safe save_state() that acquires the lock."""
+    """Thread-safe save: snapshot briefly under the lock, write outside it."""
+    global _dirty_since_save, _last_save_ts
     with state_lock:
+        _dirty_since_save = 0
+        _last_save_ts = time.monotonic()
+        payload = _snapshot_state_locked()
+    try:
+        _persist_state(payload)
+    except Exception as e:
+        log.error("Error saving state: %s", e)
+
+
+@contextlib.contextmanager
+def grouped_state_writes():
+    """Group many state mutations into batched disk writes.
+
+    Inside the block, callers mark progress with mark_state_dirty(); the
+    state file is only flushed every SAVE_EVERY_N_CHUNKS dirty marks and
+    once more on exit (also on cancel/exception), instead of after every
+    single chunk.
+    """
+    try:
+        yield
+    finally:
+        save_state()
+
+
+def _mark_state_dirty_locked():
+    """Record one batched state mutation. Assumes state_lock is held.
+       Returns a snapshot to persist when the flush threshold is hit,
+       else None; the caller must write it after releasing the lock."""
+    global _dirty_since_save, _last_save_ts
+    _dirty_since_save += 1
+    now = time.monotonic()
+    if (_dirty_since_save >= SAVE_EVERY_N_CHUNKS
+            or now - _last_save_ts >= SAVE_EVERY_SEC):
+        _dirty_since_save = 0
+        _last_save_ts = now
+        return _snapshot_state_locked()
+    return None
+
+
+def mark_state_dirty():
+    """Record one batched state mutation; flush after SAVE_EVERY_N_CHUNKS
+       mutations or SAVE_EVERY_SEC seconds, whichever comes first."""
+    with state_lock:
+        payload = _mark_state_dirty_locked()
+    if payload is not None:
         try:
-            _save_state_locked()
+            _persist_state(payload)
         except Exception as e:
-            print("Error saving state:", e)
+            log.error("Failed to save state: %s", e)
 
 
 def backup_state_file():
@@ -314,88 +608,163 @@ def reset_expired_keys():
     - Removes key from invalid_keys
     Runs under state_lock.
     """
-    now = datetime.now(timezone.utc)
-    cutoff = timedelta(days=UPDATE_INTERVAL_DAYS)
-    changed = False
+    cutoff_ts = time.time() - UPDATE_INTERVAL_DAYS * 86400
 
     with state_lock:
-        # Make a safe list because we'll pop from first_used
-        for k, dt in list(first_used.items()):
-            try:
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                if (now - dt) >= cutoff:
-                    # backup on first change (optional)
-                    if not changed:
-                        backup_state_file()
-                    key_usage[k] = 0
-                    char_usage[k] = 0
-                    first_used.pop(k, None)
-                    invalid_keys.discard(k)
-                    changed = True
-            except:
-                pass
-
-        # Also, if some keys exceed CHAR_LIMIT (perhaps imported), mark them invalid
-        for k, used in list(char_usage.items()):
+        # first_used holds unix timestamps, so the expiry check is a plain
+        # float comparison
+        expired = [k for k, ts in first_used.items() if ts <= cutoff_ts]
+        changed = bool(expired)
+        if changed:
+            backup_state_file()
+        for k in expired:
+            key_usage[k] = 0
+            char_usage[k] = 0
+            first_used.pop(k, None)
+            invalid_keys.discard(k)
+
+        # Also, if some keys exceed CHAR_LIMIT (perhaps imported), mark them
+        # invalid (no list() copy needed: only invalid_keys is mutated here)
+        for k, used in char_usage.items():
             if used >= CHAR_LIMIT:
                 invalid_keys.add(k)
 
+        _rebuild_valid_keys_locked()
+
         if changed:
-            # save state atomically while still under lock
-            try:
-                _save_state_locked()
-            except Exception as e:
-                print("Failed to persist state after reset:", e)
+            payload = _snapshot_state_locked()
+
+    if changed:
+        try:
+            _persist_state(payload)
+        except Exception as e:
+            log.error("Failed to persist state after reset: %s", e)
 
 
 # === Utility Helpers ===
+# (base, ext) -> next collision suffix to try; primed by prime_unique_counters
+_next_suffix = {}
+
+
+# matches a "<base>_<n>" collision-suffixed stem
+_SUFFIX_RE = re.compile(r"^(.*)_(\d+)$")
+
+# folders already scanned by prime_unique_counters; names we create
+# afterwards keep _next_suffix current, so one scan per folder suffices
+_primed_folders = set()
+
+
+def prime_unique_counters(folder):
+    """Scan folder once and prime the collision counters used by
+       get_unique_filepath, so re-runs into a full output folder don't
+       re-probe the directory from _1 for every file."""
+    if folder in _primed_folders:
+        return
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return
+    _primed_folders.add(folder)
+    with entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            m = _SUFFIX_RE.match(stem)
+            if not m:
+                continue
+            base = os.path.join(folder, m.group(1))
+            counter = int(m.group(2)) + 1
+            if counter > _next_suffix.get((base, ext), 1):
+                _next_suffix[(base, ext)] = counter
+
+
 def get_unique_filepath(desired_path):
+    """Reserve and return a non-clobbering path. The name is claimed with
+       O_CREAT|O_EXCL, so the check-and-create is a single atomic syscall
+       and parallel workers can't race each other onto the same file."""
     base, ext = os.path.splitext(desired_path)
-    counter = 1
+    counter = _next_suffix.get((base, ext), 1)
     unique = desired_path
-    while os.path.exists(unique):
-        unique = f"{base}_{counter}{ext}"
-        counter += 1
+    while True:
+        try:
+            os.close(os.open(unique, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            unique = f"{base}_{counter}{ext}"
+            counter += 1
+    _next_suffix[(base, ext)] = counter
     return unique
 
 
+def _rebuild_valid_keys_locked():
+    """Rebuild the rotating deque of usable keys. Assumes state_lock is held."""
+    _valid_keys.clear()
+    _valid_keys.extend(
+        k for k in API_KEYS
+        if k not in invalid_keys and char_usage.get(k, 0) < CHAR_LIMIT
+    )
+
+
+def _invalidate_key_locked(key):
+    """Mark key invalid and drop it from the rotation. Assumes state_lock is held."""
+    invalid_keys.add(key)
+    try:
+        _valid_keys.remove(key)
+    except ValueError:
+        pass
+
+
 def get_next_valid_api_key():
     """
-    Cycle through API_KEYS, skipping those invalid.
+    Cycle through the valid keys in O(1), rotating the deque.
     Raises RuntimeError if none remain.
     """
-    global current_key_index
-    n = len(API_KEYS)
-
-    # small critical section to choose a key and advance index
     with state_lock:
-        for _ in range(n):
-            key = API_KEYS[current_key_index]
-            # Check if a key is valid and under CHAR_LIMIT
-            current_key_index = (current_key_index + 1) % n
-            if key in invalid_keys:
-                continue
-            used = char_usage.get(key, 0)
-            if used < CHAR_LIMIT:
-                return key
-            else:
-                invalid_keys.add(key)
-    raise RuntimeError("No valid API keys available.")
+        if not _valid_keys:
+            # defensive rebuild (e.g. keys loaded but deque never primed)
+            _rebuild_valid_keys_locked()
+        if not _valid_keys:
+            raise RuntimeError("No valid API keys available.")
+        key = _valid_keys[0]
+        _valid_keys.rotate(-1)
+        return key
+
+
+def throttle_key(key):
+    """Token bucket per key: reserve the key's next send slot, then sleep
+       until it arrives. Because the reservation happens under the lock,
+       several workers holding the same key queue up on distinct slots
+       instead of all dispatching at once."""
+    with state_lock:
+        now = time.monotonic()
+        start = max(now, _key_next_send.get(key, now))
+        _key_next_send[key] = start + PER_KEY_MIN_INTERVAL
+    wait = start - now
+    if wait > 0:
+        time.sleep(wait)
+
+
+# compiled once: chunk_text runs it over the whole input on every Start
+_WORD_RE = re.compile(r'\S+')
 
 
 def chunk_text(text, chunk_size=2500):
-    """Split text into word-safe chunks of ~chunk_size chars."""
-    words = text.split()
-    chunks, curr, length = [], [], 0
-    for w in words:
-        if length + len(w) + 1 <= chunk_size:
-            curr.append(w)
-            length += len(w) + 1
-        else:
-            chunks.append(" ".join(curr))
-            curr, length = [w], len(w)
-    if curr: chunks.append(" ".join(curr))
+    """Split text into word-safe chunks of ~chunk_size chars.
+
+    Walks word spans in the original string and emits slices of it, so
+    no intermediate word list or per-chunk join/copy is allocated.
+    """
+    chunks = []
+    chunk_start = None
+    prev_end = 0
+    for m in _WORD_RE.finditer(text):
+        if chunk_start is None:
+            chunk_start = m.start()
+        elif m.end() - chunk_start > chunk_size:
+            chunks.append(text[chunk_start:prev_end])
+            chunk_start = m.start()
+        prev_end = m.end()
+    if chunk_start is not None:
+        chunks.append(text[chunk_start:prev_end])
     return chunks
 
 
@@ -405,93 +774,134 @@ def send_to_elevenlabs_api(chunk, api_key, output_path, voice_id=DEFAULT_VOICE_I
     Send chunk, save MP3; returns True on success. Marks key invalid on 401/403.
     """
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
+    # pre-serialized body skips requests' json= handling and content-type
+    # inference; Content-Type itself is a session default
+    body = _dumps_compact({"text": chunk, "voice_settings": VOICE_SETTINGS})
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             url,
-            json={"text": chunk, "voice_settings": VOICE_SETTINGS},
-            headers={"xi-api-key": api_key, "Content-Type": "application/json"},
-            timeout=timeout
+            data=body,
+            headers={"xi-api-key": api_key},
+            timeout=timeout,
+            stream=True
         )
     except requests.RequestException as e:
-        print("Network error:", e)
+        log.error("Network error: %s", e)
         return False
 
     if resp.status_code == 200:
         safe = get_unique_filepath(output_path)
         try:
-            with open(safe, 'wb') as f:
-                f.write(resp.content)
+            # stream straight to disk instead of buffering the whole MP3 in
+            # RAM; iter_content (unlike resp.raw) also undoes any transport
+            # compression, and closing() releases the pooled socket
+            with contextlib.closing(resp), open(safe, 'wb', buffering=1024 * 1024) as f:
+                for part in resp.iter_content(chunk_size=64 * 1024):
+                    f.write(part)
         except Exception as e:
-            print("Disk write error:", e)
+            log.error("Disk write error: %s", e)
             return False
-        print(f"Audio saved to: {safe}\n")
+        log.info("Audio saved to: %s\n", safe)
         return True
     else:
-        print(f"Error {resp.status_code}: {resp.text}\n")
+        log.error("Error %s: %s\n", resp.status_code, resp.text)
+        resp.close()
         if resp.status_code in (401, 403):
             with state_lock:
-                invalid_keys.add(api_key)
+                _invalidate_key_locked(api_key)
                 key_usage[api_key] = 4
                 char_usage[api_key] = 4
         return False
 
 
+def _send_chunk_task(chunk, key, path, voice_id, cancel_event=None):
+    """Worker task for one chunk: throttle, send, record usage on success."""
+    if cancel_event is not None and cancel_event.is_set():
+        return False
+
+    # the key pinned at submit time is only a hint: if it died (401/403)
+    # or crossed the quota while this task sat in the queue, pick a live
+    # one instead of burning the chunk on a known-bad key
+    with state_lock:
+        if key in invalid_keys or char_usage.get(key, 0) >= CHAR_LIMIT:
+            key = get_next_valid_api_key()
+
+    # wait out the per-key budget, then send without holding lock
+    throttle_key(key)
+    success = send_to_elevenlabs_api(chunk, key, path, voice_id)
+    if not success:
+        # skip usage tracking on failure (send_to_elevenlabs_api may have invalidated key)
+        return False
+
+    # Update in-memory state and record the dirty mark in one lock
+    # acquisition; any due snapshot is written after the lock is released.
+    with state_lock:
+        if key not in first_used:
+            first_used[key] = time.time()
+        key_usage[key] = key_usage.get(key, 0) + 1
+        char_usage[key] = char_usage.get(key, 0) + len(chunk)
+        if char_usage[key] >= CHAR_LIMIT:
+            _invalidate_key_locked(key)
+        payload = _mark_state_dirty_locked()
+    if payload is not None:
+        try:
+            _persist_state(payload)
+        except Exception as e:
+            log.error("Failed to save state: %s", e)
+    return True
+
+
 def process_text(text, output_folder, base_filename, voice_id,
-                 progress_callback=None, cancel_check=None):
+                 progress_callback=None, cancel_event=None):
     """
     Main orchestration: chunk text, rotate keys, track usage and dates, invalidate as needed.
+    Chunks are dispatched in parallel across valid keys (the work is I/O bound);
+    ordered filenames are assigned before submission so output stays sequential.
     """
-    load_keys()
-    load_state()
+    ensure_state_loaded()
+    prime_unique_counters(output_folder)
     chunks = chunk_text(text)
 
     if progress_callback:
         progress_callback(0, len(chunks))
 
-    for i, chunk in enumerate(chunks, start=1):
-        if cancel_check and cancel_check():
-            print("Processing cancelled.\n")
-            break
-
-        try:
-            key = get_next_valid_api_key()
-        except RuntimeError:
-            print("No valid API key left. Stopping.\n")
-            break
-
-        # On first use and counters / file writing must be done under lock (but not the network call)
-        # Build filename / path
-        n_chars = len(chunk)
-        filename = f"{base_filename}_{i}.mp3"
-        path = os.path.join(output_folder, filename)
-
-        # send without holding lock
-        success = send_to_elevenlabs_api(chunk, key, path, voice_id)
-        if not success:
-            # skip usage tracking on failure (send_to_elevenlabs_api may have invalidated key)
-            continue
-
-        # Update in-memory state and persist under lock
-        with state_lock:
-            if key not in first_used:
-                first_used[key] = datetime.now(timezone.utc)
-            key_usage[key] = key_usage.get(key, 0) + 1
-            char_usage[key] = char_usage.get(key, 0) + n_chars
-            if char_usage[key] >= CHAR_LIMIT:
-                invalid_keys.add(key)
-            # persist updated state atomically
-            try:
-                _save_state_locked()
-            except Exception as e:
-                print("Failed to save state:", e)
-
-        if progress_callback:
-            progress_callback(i, len(chunks))
-
-        time.sleep(3)
-
-    # ensure final state persisted
-    save_state()
+    with state_lock:
+        n_valid = len(_valid_keys) or len(API_KEYS)
+    # bounded: more in-flight requests than this mostly queue at the API
+    max_workers = max(1, min(n_valid, MAX_PARALLEL_CHUNKS))
+
+    with grouped_state_writes():
+        futures = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for i, chunk in enumerate(chunks, start=1):
+                if cancel_event is not None and cancel_event.is_set():
+                    log.info("Processing cancelled.\n")
+                    break
+
+                try:
+                    key = get_next_valid_api_key()
+                except RuntimeError:
+                    log.error("No valid API key left. Stopping.\n")
+                    break
+
+                path = os.path.join(output_folder, f"{base_filename}_{i}.mp3")
+                futures.append(executor.submit(
+                    _send_chunk_task, chunk, key, path, voice_id, cancel_event))
+
+            cancelled = False
+            for done, future in enumerate(as_completed(futures), start=1):
+                if not cancelled and cancel_event is not None and cancel_event.is_set():
+                    # stop queued chunks; in-flight ones bail out on their own
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    cancelled = True
+                try:
+                    future.result()
+                except CancelledError:
+                    pass
+                except Exception as e:
+                    log.error("Chunk failed: %s", e)
+                if progress_callback:
+                    progress_callback(done, len(chunks))
 
 
 # === GUI ===
@@ -533,132 +943,308 @@ COLORS_DARK = {
     'button_hover': '#2e2e2e',
 }
 
-# Default to light theme
-COLORS = COLORS_LIGHT.copy()
+# Active theme palette; rebound (not mutated) by App._apply_theme, so a
+# theme flip is one name swap instead of copying every entry
+COLORS = COLORS_LIGHT
+
+
+def _build_ttk_styles(colors):
+    """Precompute the ttk option dicts for one theme so a theme flip only
+       pushes three ready-made calls into Tcl instead of rebuilding the
+       dicts (and the style.map lists) every time."""
+    return {
+        'TProgressbar': {
+            'background': colors['accent'],
+            'troughcolor': colors['bg_tertiary'],
+            'borderwidth': 0,
+            'lightcolor': colors['accent'],
+            'darkcolor': colors['accent'],
+        },
+        'TCombobox': {
+            'fieldbackground': colors['input_bg'],
+            'background': colors['input_bg'],
+            'foreground': colors['text_primary'],
+            'borderwidth': 2,
+            'relief': 'flat',
+            'padding': 8,
+        },
+        'TCombobox.map': {
+            'fieldbackground': [('readonly', colors['input_bg'])],
+            'background': [('readonly', colors['input_bg'])],
+            'foreground': [('readonly', colors['text_primary'])],
+            'bordercolor': [('focus', colors['accent']), ('!focus', colors['border'])],
+            'lightcolor': [('focus', colors['accent'])],
+            'darkcolor': [('focus', colors['accent'])],
+        },
+    }
+
+
+_TTK_STYLES = {
+    'light': _build_ttk_styles(COLORS_LIGHT),
+    'dark': _build_ttk_styles(COLORS_DARK),
+}
+
+
+def _build_theme_presets(colors):
+    """Precompute the color kwargs for each widget kind in one theme, so
+       widget creation and theme flips pass a ready-made dict to a single
+       configure() call instead of assembling kwargs per widget."""
+    return {
+        'frame': {'bg': colors['bg_primary']},
+        'border_frame': {'bg': colors['border']},
+        'label': {'bg': colors['bg_primary'], 'fg': colors['text_primary']},
+        'label_secondary': {'bg': colors['bg_primary'], 'fg': colors['text_secondary']},
+        'entry': {
+            'bg': colors['input_bg'], 'fg': colors['text_primary'],
+            'insertbackground': colors['text_primary'],
+            'highlightcolor': colors['accent'],
+            'highlightbackground': colors['border'],
+        },
+        'text': {
+            'bg': colors['input_bg'], 'fg': colors['text_primary'],
+            'insertbackground': colors['text_primary'],
+            'selectbackground': colors['accent'],
+            'selectforeground': 'white',
+            'highlightcolor': colors['accent'],
+            'highlightbackground': colors['border'],
+        },
+        'log_text': {
+            'bg': colors['bg_tertiary'], 'fg': colors['text_primary'],
+            'insertbackground': colors['text_primary'],
+            'selectbackground': colors['accent'],
+            'selectforeground': 'white',
+        },
+        'button': {
+            'bg': colors['button_bg'], 'fg': colors['text_primary'],
+            'activebackground': colors['button_hover'],
+            'activeforeground': colors['text_primary'],
+            'highlightbackground': colors['button_border'],
+        },
+        'button_disabled': {'bg': colors['bg_tertiary'], 'fg': colors['text_tertiary']},
+        'button_accent': {
+            'bg': colors['accent'], 'fg': 'white',
+            'activebackground': colors['accent_hover'],
+            'activeforeground': 'white',
+        },
+    }
+
+
+THEME_PRESETS = {
+    'light': _build_theme_presets(COLORS_LIGHT),
+    'dark': _build_theme_presets(COLORS_DARK),
+}
+
+# presets of the active theme; rebound by App._apply_theme alongside COLORS
+_active_presets = THEME_PRESETS['light']
+
+# theme-independent options shared by the prominent accent buttons
+# (Start, Save); built once so each construction site just splats it
+ACCENT_BTN_OPTS = {
+    'relief': 'flat', 'bd': 0,
+    'padx': 20, 'pady': 10,
+    'font': 'AppBold',
+    'cursor': 'hand2',
+    'highlightthickness': 0,
+}
+
+
+# Per-kind theme appliers for registered widgets. Theme toggles iterate
+# the registry and dispatch on the kind recorded at creation time, so no
+# winfo_class()/cget() probing is needed to figure out how to recolor.
+def _apply_preset(kind, w):
+    w.configure(**_active_presets[kind])
+
+
+def _theme_button(w):
+    # disabled buttons keep their muted styling (e.g. the Cancel button)
+    if w.cget('state') == 'disabled':
+        w.configure(**_active_presets['button_disabled'])
+        return
+    w.configure(**_active_presets['button'])
+
+
+_THEME_APPLY = {kind: functools.partial(_apply_preset, kind)
+                for kind in ('frame', 'border_frame', 'label', 'label_secondary',
+                             'entry', 'text', 'log_text', 'button_accent')}
+_THEME_APPLY['button'] = _theme_button
+
+
+# Handlers for the recursive dialog walker, keyed by winfo_class(). Each
+# contains exactly the configure() valid for that widget class, so the
+# walk needs no try/except guards; a cget probe survives only where the
+# class alone can't distinguish the styling (border frames, log text,
+# accent/disabled buttons).
+def _walk_cfg_toplevel(w):
+    w.configure(bg=COLORS['bg_primary'])
+
+
+def _walk_cfg_frame(w):
+    if w.cget('bg') in (COLORS_LIGHT['border'], COLORS_DARK['border']):
+        w.configure(**_active_presets['border_frame'])
+    else:
+        w.configure(**_active_presets['frame'])
+
+
+def _walk_cfg_label(w):
+    fg = w.cget('fg')
+    if fg in (COLORS_LIGHT['text_secondary'], COLORS_DARK['text_secondary']):
+        w.configure(**_active_presets['label_secondary'])
+    elif fg in (COLORS_LIGHT['text_tertiary'], COLORS_DARK['text_tertiary']):
+        w.configure(bg=COLORS['bg_primary'], fg=COLORS['text_tertiary'])
+    else:
+        w.configure(**_active_presets['label'])
+
+
+def _walk_cfg_entry(w):
+    w.configure(**_active_presets['entry'])
+
+
+def _walk_cfg_text(w):
+    if w.cget('bg') in (COLORS_LIGHT['bg_tertiary'], COLORS_DARK['bg_tertiary']):
+        w.configure(**_active_presets['log_text'])
+    else:
+        w.configure(**_active_presets['text'])
+
+
+def _walk_cfg_button(w):
+    bg = w.cget('bg')
+    if bg in (COLORS_LIGHT['accent'], COLORS_DARK['accent']):
+        w.configure(**_active_presets['button_accent'])
+    elif w.cget('state') == 'disabled':
+        if bg in (COLORS_LIGHT['bg_tertiary'], COLORS_DARK['bg_tertiary']):
+            w.configure(**_active_presets['button_disabled'])
+    else:
+        w.configure(**_active_presets['button'])
+
+
+_WALK_HANDLERS = {
+    'Toplevel': _walk_cfg_toplevel,
+    'Frame': _walk_cfg_frame,
+    'Label': _walk_cfg_label,
+    'Entry': _walk_cfg_entry,
+    'Text': _walk_cfg_text,
+    'ScrolledText': _walk_cfg_text,
+    'Button': _walk_cfg_button,
+}
+
 
 class App:
     def __init__(self, root):
         self.root = root
         root.title(f"AIVerse TTS GUI - v{VERSION}")
-        self.queue = queue.Queue()
-        self.cancel_requested = False
+        # pending log text; deque append/popleft are atomic, and draining
+        # needs no queue.Empty exception handling
+        self.queue = collections.deque()
+        self.cancel_event = threading.Event()
+        self._count_after = None  # pending debounced character-count update
+        self._last_count = None  # last character count shown in the label
+        self._ui_batch_depth = 0  # nesting depth of _batch_ui_updates
+        self._theme_version = 0  # bumped on every palette switch
+        # finished (mapping, sorted_names) keyed by voice-cache mtime
+        self._voices_memo = {"mtime": None, "result": None}
+
+        # Parse the on-disk voice cache concurrently with widget
+        # construction; its after(0) hand-off runs once mainloop starts,
+        # well after the Combobox exists. The network refresh stays
+        # deferred to the first dropdown click.
+        self._voices_loaded = False
+        threading.Thread(target=self._load_cached_voices, daemon=True).start()
 
         # Load theme preference
         cfg = load_config()
         self.theme = cfg.get("theme", "light")
         self._apply_theme(self.theme)
+        # widgets below are built with this theme's colors, so a re-apply
+        # of the same theme can skip the recolor pass entirely
+        self._applied_theme = self.theme
 
         # Configure root window
         root.configure(bg=COLORS['bg_primary'])
-        # Use better, larger font for readability
+        # Use better, larger font for readability. Named fonts are created
+        # once and passed by name, so Tk parses each spec a single time
+        # instead of per widget.
         if os.name == 'nt':
             default_font = ('Segoe UI', 11)
-            label_font = ('Segoe UI', 11, 'normal')
         else:
             default_font = ('Helvetica', 11)
-            label_font = ('Helvetica', 11, 'normal')
-        root.option_add('*Font', default_font)
-        self.label_font = label_font
+        family, size = default_font
+        tkfont.Font(root=root, name='AppDefault', family=family, size=size)
+        tkfont.Font(root=root, name='AppBold', family=family, size=size, weight='bold')
+        tkfont.Font(root=root, name='AppSmall', family=family, size=size - 1)
+        tkfont.Font(root=root, name='AppMono', family='Consolas', size=size - 1)
+        root.option_add('*Font', 'AppDefault')
+        self.label_font = 'AppDefault'
         self.default_font = default_font
         
-        # Store widget references for theme updates
+        # Registry of (kind, widget) pairs driving theme updates; see
+        # _THEME_APPLY for the per-kind recolor functions
         self.theme_widgets = []
         
-        # Configure ttk styles
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Style the progress bar
-        style.configure('TProgressbar',
-                       background=COLORS['accent'],
-                       troughcolor=COLORS['bg_tertiary'],
-                       borderwidth=0,
-                       lightcolor=COLORS['accent'],
-                       darkcolor=COLORS['accent'])
-        
-        # Style the combobox
-        style.configure('TCombobox',
-                       fieldbackground=COLORS['input_bg'],
-                       background=COLORS['input_bg'],
-                       foreground=COLORS['text_primary'],
-                       borderwidth=2,
-                       relief='flat',
-                       padding=8)
-        style.map('TCombobox',
-                 fieldbackground=[('readonly', COLORS['input_bg'])],
-                 background=[('readonly', COLORS['input_bg'])],
-                 foreground=[('readonly', COLORS['text_primary'])],
-                 bordercolor=[('focus', COLORS['accent']), ('!focus', COLORS['border'])],
-                 lightcolor=[('focus', COLORS['accent'])],
-                 darkcolor=[('focus', COLORS['accent'])])
-        
+        # Configure ttk styles (progress bar + combobox) from the
+        # precomputed per-theme tables
+        self._ttk_theme_applied = None
+        ttk.Style().theme_use('clam')
+        self._apply_ttk_styles()
+
         # Main container with padding
-        main_frame = tk.Frame(root, bg=COLORS['bg_primary'], padx=24, pady=16)
+        main_frame = self._register('frame', tk.Frame(root, padx=24, pady=16, **_active_presets['frame']))
         main_frame.grid(row=0, column=0, sticky="nsew")
         root.grid_columnconfigure(0, weight=1)
         root.grid_rowconfigure(0, weight=1)
 
         # Input file section - fixed width labels for alignment
-        file_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        file_frame = self._register('frame', tk.Frame(main_frame, **_active_presets['frame']))
         file_frame.grid(row=0, column=0, columnspan=3, sticky="ew", pady=(0, 12))
-        tk.Label(file_frame, text="Input .txt file:", bg=COLORS['bg_primary'], 
-                fg=COLORS['text_primary'], font=self.label_font, width=14, anchor='w').grid(row=0, column=0, sticky="w", padx=(0, 12))
-        self.input_file = tk.Entry(file_frame, width=50, relief='flat', bd=0,
-                                  bg=COLORS['input_bg'], fg=COLORS['text_primary'],
-                                  insertbackground=COLORS['text_primary'],
-                                  font=self.default_font,
-                                  highlightthickness=2, highlightcolor=COLORS['accent'],
-                                  highlightbackground=COLORS['border'])
+        self._register('label', tk.Label(file_frame, text="Input .txt file:", font=self.label_font, width=14, anchor='w',
+                **_active_presets['label'])).grid(row=0, column=0, sticky="w", padx=(0, 12))
+        self.input_file = self._register('entry', tk.Entry(file_frame, width=50, relief='flat', bd=0,
+                                  font='AppDefault', highlightthickness=2,
+                                  **_active_presets['entry']))
         self.input_file.grid(row=0, column=1, sticky="we", padx=(0, 8))
         file_frame.grid_columnconfigure(1, weight=1)
         self._create_styled_button(file_frame, "Browse...", self.browse_input).grid(row=0, column=2, sticky="e")
 
         # Output folder section
-        output_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        output_frame = self._register('frame', tk.Frame(main_frame, **_active_presets['frame']))
         output_frame.grid(row=1, column=0, columnspan=3, sticky="ew", pady=(0, 12))
-        tk.Label(output_frame, text="Output folder:", bg=COLORS['bg_primary'],
-                fg=COLORS['text_primary'], font=self.label_font, width=14, anchor='w').grid(row=0, column=0, sticky="w", padx=(0, 12))
-        self.output_folder = tk.Entry(output_frame, width=50, relief='flat', bd=0,
-                                      bg=COLORS['input_bg'], fg=COLORS['text_primary'],
-                                      insertbackground=COLORS['text_primary'],
-                                      font=self.default_font,
-                                      highlightthickness=2, highlightcolor=COLORS['accent'],
-                                      highlightbackground=COLORS['border'])
+        self._register('label', tk.Label(output_frame, text="Output folder:", font=self.label_font, width=14, anchor='w',
+                **_active_presets['label'])).grid(row=0, column=0, sticky="w", padx=(0, 12))
+        self.output_folder = self._register('entry', tk.Entry(output_frame, width=50, relief='flat', bd=0,
+                                      font='AppDefault', highlightthickness=2,
+                                      **_active_presets['entry']))
         self.output_folder.grid(row=0, column=1, sticky="we", padx=(0, 8))
         output_frame.grid_columnconfigure(1, weight=1)
         self._create_styled_button(output_frame, "Browse...", self.browse_output).grid(row=0, column=2, sticky="e")
 
         # Base filename section
-        name_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        name_frame = self._register('frame', tk.Frame(main_frame, **_active_presets['frame']))
         name_frame.grid(row=2, column=0, columnspan=3, sticky="ew", pady=(0, 12))
-        tk.Label(name_frame, text="Base filename:", bg=COLORS['bg_primary'],
-                fg=COLORS['text_primary'], font=self.label_font, width=14, anchor='w').grid(row=0, column=0, sticky="w", padx=(0, 12))
-        self.base_name = tk.Entry(name_frame, width=50, relief='flat', bd=0,
-                                  bg=COLORS['input_bg'], fg=COLORS['text_primary'],
-                                  insertbackground=COLORS['text_primary'],
-                                  font=self.default_font,
-                                  highlightthickness=2, highlightcolor=COLORS['accent'],
-                                  highlightbackground=COLORS['border'])
+        self._register('label', tk.Label(name_frame, text="Base filename:", font=self.label_font, width=14, anchor='w',
+                **_active_presets['label'])).grid(row=0, column=0, sticky="w", padx=(0, 12))
+        self.base_name = self._register('entry', tk.Entry(name_frame, width=50, relief='flat', bd=0,
+                                  font='AppDefault', highlightthickness=2,
+                                  **_active_presets['entry']))
         self.base_name.grid(row=0, column=1, sticky="we", padx=(0, 8))
         name_frame.grid_columnconfigure(1, weight=1)
 
         # Voice selection and Manage Keys section
-        voice_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        voice_frame = self._register('frame', tk.Frame(main_frame, **_active_presets['frame']))
         voice_frame.grid(row=3, column=0, columnspan=3, sticky="ew", pady=(0, 12))
-        self.theme_widgets.append(('frame', voice_frame))
-        voice_label = tk.Label(voice_frame, text="Voice:", bg=COLORS['bg_primary'],
-                fg=COLORS['text_primary'], font=self.label_font, width=14, anchor='w')
+        voice_label = self._register('label', tk.Label(voice_frame, text="Voice:", font=self.label_font, width=14, anchor='w',
+                **_active_presets['label']))
         voice_label.grid(row=0, column=0, sticky="w", padx=(0, 12))
-        self.theme_widgets.append(('label', voice_label))
         
         # Voice selection dropdown (using ttk.Combobox for better styling)
         self.voice_map = {"Glinda": DEFAULT_VOICE_ID}
         self.voice_var = tk.StringVar(root)
         self.voice_var.set("Glinda")
+        self._voice_names = ("Glinda",)  # sorted names for the dropdown
+        self._voice_values_pushed = self._voice_names  # last list sent to Tcl
         self.voice_menu = ttk.Combobox(voice_frame, textvariable=self.voice_var,
-                                       values=list(self.voice_map.keys()),
+                                       values=self._voice_names,
+                                       postcommand=self._populate_voice_menu,
                                        state='readonly', style='TCombobox',
-                                       font=self.default_font)
+                                       font='AppDefault')
         self.voice_menu.grid(row=0, column=1, sticky="w", padx=(0, 8))
         voice_frame.grid_columnconfigure(1, weight=1)
         
@@ -666,63 +1252,59 @@ class App:
         theme_icon = "☾" if self.theme == "light" else "◉"  # Moon and Sun symbols
         self.theme_btn = tk.Button(voice_frame, text=theme_icon,
                                    command=self.toggle_theme,
-                                   bg=COLORS['button_bg'], fg=COLORS['text_primary'],
-                                   activebackground=COLORS['button_hover'],
-                                   activeforeground=COLORS['text_primary'],
                                    relief='flat', bd=0,
                                    highlightthickness=2,
                                    highlightcolor=COLORS['accent'],
-                                   highlightbackground=COLORS['button_border'],
                                    padx=10, pady=8,
-                                   font=(self.default_font[0], self.default_font[1], 'normal'),
+                                   **_active_presets['button'],
+                                   font='AppDefault',
                                    cursor='hand2',
                                    width=3,
                                    anchor='center')
         self.theme_btn.grid(row=0, column=2, sticky="e", padx=(0, 8))
         self.theme_widgets.append(('button', self.theme_btn))
-        
+
+
         # Manage keys button
         manage_keys_btn = self._create_styled_button(voice_frame, "Manage Keys", self.manage_keys)
         manage_keys_btn.grid(row=0, column=3, sticky="e")
 
-        # Spawn background thread to refresh voices from cache/API
-        threading.Thread(target=self._async_load_voices, daemon=True).start()
+        # The cached voice list is loading in the background (started at
+        # the top of __init__); only the refresh trigger is bound here
+        self.voice_menu.bind('<Button-1>', self._maybe_load_voices, add='+')
 
         # Text area section
-        text_label_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        text_label_frame = self._register('frame', tk.Frame(main_frame, **_active_presets['frame']))
         text_label_frame.grid(row=4, column=0, columnspan=3, sticky="ew", pady=(0, 8))
-        tk.Label(text_label_frame, text="Input text:", bg=COLORS['bg_primary'],
-                fg=COLORS['text_primary'], font=self.label_font, width=14, anchor='w').grid(row=0, column=0, sticky="w")
-        
+        self._register('label', tk.Label(text_label_frame, text="Input text:", font=self.label_font, width=14, anchor='w',
+                **_active_presets['label'])).grid(row=0, column=0, sticky="w")
+
         # Text input area with styled border
-        text_container = tk.Frame(main_frame, bg=COLORS['border'], padx=2, pady=2)
+        text_container = self._register('border_frame', tk.Frame(main_frame, padx=2, pady=2, **_active_presets['border_frame']))
         text_container.grid(row=5, column=0, columnspan=3, sticky="ew", pady=(0, 12))
         self.text_input = scrolledtext.ScrolledText(text_container, width=60, height=10,
                                                     relief='flat', bd=0,
-                                                    bg=COLORS['input_bg'], fg=COLORS['text_primary'],
-                                                    insertbackground=COLORS['text_primary'],
-                                                    selectbackground=COLORS['accent'],
-                                                    selectforeground='white',
-                                                    font=self.default_font,
-                                                    wrap=tk.WORD)
+                                                    highlightthickness=1,
+                                                    font='AppDefault',
+                                                    wrap=tk.WORD,
+                                                    **_active_presets['text'])
+        self._register('text', self.text_input)
         self.text_input.pack(fill='both', expand=True)
         self.text_input.bind("<KeyRelease>", self.update_count)
-        self.text_input.bind("<FocusIn>", lambda e: text_container.config(bg=COLORS['accent']))
-        self.text_input.bind("<FocusOut>", lambda e: text_container.config(bg=COLORS['border']))
 
         # Character count and buttons
-        control_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        control_frame = self._register('frame', tk.Frame(main_frame, **_active_presets['frame']))
         control_frame.grid(row=6, column=0, columnspan=3, sticky="ew", pady=(0, 12))
-        self.count_label = tk.Label(control_frame, text="Character count: 0",
-                                    bg=COLORS['bg_primary'], fg=COLORS['text_secondary'],
-                                    font=(self.default_font[0], self.default_font[1] - 1))
+        self.count_label = self._register('label_secondary', tk.Label(control_frame, text="Character count: 0",
+                                    font='AppSmall',
+                                    **_active_presets['label_secondary']))
         self.count_label.grid(row=0, column=0, sticky="w")
         control_frame.grid_columnconfigure(0, weight=1)
-        
+
         # Button frame
-        self.button_frame = tk.Frame(control_frame, bg=COLORS['bg_primary'])
+        self.button_frame = self._register('frame', tk.Frame(control_frame, **_active_presets['frame']))
         self.button_frame.grid(row=0, column=1, sticky="e")
-        
+
         # Cancel button
         self.cancel_btn = self._create_styled_button(self.button_frame, "Cancel", self.cancel)
         self.cancel_btn.pack(side="left", padx=(0, 8))
@@ -731,41 +1313,41 @@ class App:
 
         # Start button (accent color) - make it more prominent
         self.start_btn = tk.Button(self.button_frame, text="Start", command=self.start,
-                                  bg=COLORS['accent'], fg='white',
-                                  activebackground=COLORS['accent_hover'],
-                                  activeforeground='white',
-                                  relief='flat', bd=0,
-                                  padx=20, pady=10,
-                                  font=(self.default_font[0], self.default_font[1], 'bold'),
-                                  cursor='hand2',
-                                  highlightthickness=0)
+                                  **ACCENT_BTN_OPTS,
+                                  **_active_presets['button_accent'])
+        self._register('button_accent', self.start_btn)
         self.start_btn.pack(side="left")
 
         # Progress bar
-        progress_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        progress_frame = self._register('frame', tk.Frame(main_frame, **_active_presets['frame']))
         progress_frame.grid(row=7, column=0, columnspan=3, sticky="ew", pady=(0, 12))
         self.progress = ttk.Progressbar(progress_frame, orient='horizontal', mode='determinate',
                                        length=300, style='TProgressbar')
         self.progress.pack(fill='x', expand=True)
 
         # Logs section
-        logs_label_frame = tk.Frame(main_frame, bg=COLORS['bg_primary'])
+        logs_label_frame = self._register('frame', tk.Frame(main_frame, **_active_presets['frame']))
         logs_label_frame.grid(row=8, column=0, columnspan=3, sticky="ew", pady=(0, 8))
-        tk.Label(logs_label_frame, text="Logs:", bg=COLORS['bg_primary'],
-                fg=COLORS['text_primary'], font=self.label_font, width=14, anchor='w').grid(row=0, column=0, sticky="w")
-        
+        self._register('label', tk.Label(logs_label_frame, text="Logs:", font=self.label_font, width=14, anchor='w',
+                **_active_presets['label'])).grid(row=0, column=0, sticky="w")
+
         # Log widget with styled border
-        logs_container = tk.Frame(main_frame, bg=COLORS['border'], padx=2, pady=2)
+        logs_container = self._register('border_frame', tk.Frame(main_frame, padx=2, pady=2, **_active_presets['border_frame']))
         logs_container.grid(row=9, column=0, columnspan=3, sticky="nsew")
         self.log_widget = scrolledtext.ScrolledText(logs_container, width=60, height=10,
                                                     state='disabled', relief='flat', bd=0,
-                                                    bg=COLORS['bg_tertiary'], fg=COLORS['text_primary'],
-                                                    font=('Consolas', self.default_font[1] - 1),
-                                                    wrap=tk.WORD)
+                                                    font='AppMono',
+                                                    wrap=tk.WORD,
+                                                    **_active_presets['log_text'])
+        self._register('log_text', self.log_widget)
         self.log_widget.pack(fill='both', expand=True)
 
-        # Poll for logs
-        self.root.after(100, self.poll_queue)
+        # Drain logs when the worker signals there is something to show,
+        # instead of waking up every 100 ms
+        self.root.bind("<<LogMessage>>", self.poll_queue)
+
+        # From here on, backend log records land in the GUI queue directly
+        _log_listener.handlers = (_GuiLogHandler(self),)
 
         # Allow resizing
         main_frame.grid_columnconfigure(0, weight=1)
@@ -774,32 +1356,51 @@ class App:
         # Store main_frame for theme updates
         self.main_frame = main_frame
     
+    def _register(self, kind, widget):
+        """Record a widget in the theme registry under its style kind."""
+        self.theme_widgets.append((kind, widget))
+        return widget
+
+    @contextlib.contextmanager
+    def _batch_ui_updates(self):
+        """Reentrant batching of visual updates: nested blocks defer the
+           idle-task flush to the outermost exit, so a compound theme pass
+           repaints once instead of per sub-step."""
+        self._ui_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._ui_batch_depth -= 1
+            if self._ui_batch_depth == 0:
+                self.root.update_idletasks()
+
     def _apply_theme(self, theme):
         """Apply theme colors globally."""
-        global COLORS
+        global COLORS, _active_presets
         if theme == "dark":
-            COLORS.update(COLORS_DARK)
+            COLORS = COLORS_DARK
+            _active_presets = THEME_PRESETS['dark']
         else:
-            COLORS.update(COLORS_LIGHT)
+            COLORS = COLORS_LIGHT
+            _active_presets = THEME_PRESETS['light']
         self.theme = theme
+        self._theme_version = getattr(self, '_theme_version', 0) + 1
     
     def toggle_theme(self):
         """Toggle between light and dark themes."""
         self.theme = "dark" if self.theme == "light" else "light"
         self._apply_theme(self.theme)
-        self._update_all_widgets()
-        
-        # Update theme button icon and colors (preserve button styling)
+
         theme_icon = "◉" if self.theme == "dark" else "☾"  # Sun (◉) for dark mode, Moon (☾) for light mode
-        self.theme_btn.config(text=theme_icon,
-                             bg=COLORS['button_bg'], fg=COLORS['text_primary'],
-                             activebackground=COLORS['button_hover'],
-                             activeforeground=COLORS['text_primary'],
-                             highlightbackground=COLORS['button_border'])
-        
-        # Update manage keys window if open
-        if hasattr(self, '_update_manage_keys'):
-            self._update_manage_keys()
+        with self._batch_ui_updates():
+            self._update_all_widgets()
+
+            # Update theme button icon and colors (preserve button styling)
+            self.theme_btn.config(text=theme_icon, **_active_presets['button'])
+
+            # Update manage keys window if open
+            if hasattr(self, '_update_manage_keys'):
+                self._update_manage_keys()
         
         # Save theme preference
         cfg = load_config()
@@ -807,144 +1408,73 @@ class App:
         save_config(cfg)
         save_config._current_theme = self.theme
     
+    def _apply_ttk_styles(self):
+        """Push the precomputed ttk styles for the current theme into Tcl;
+           no-op when that theme is already applied."""
+        if self._ttk_theme_applied == self.theme:
+            return
+        styles = _TTK_STYLES.get(self.theme, _TTK_STYLES['light'])
+        style = ttk.Style()
+        style.configure('TProgressbar', **styles['TProgressbar'])
+        style.configure('TCombobox', **styles['TCombobox'])
+        style.map('TCombobox', **styles['TCombobox.map'])
+        self._ttk_theme_applied = self.theme
+
     def _update_all_widgets(self):
-        """Update all widgets with current theme colors."""
+        """Update all widgets with current theme colors. No-ops when the
+           widgets already show the active theme (widgets are created with
+           the persisted theme's colors, so the first call is free too)."""
+        if getattr(self, '_applied_theme', None) == self.theme:
+            return
+        self._applied_theme = self.theme
+
         # Update root window
         self.root.configure(bg=COLORS['bg_primary'])
-        
-        # Update ttk styles
-        style = ttk.Style()
-        style.configure('TProgressbar',
-                       background=COLORS['accent'],
-                       troughcolor=COLORS['bg_tertiary'],
-                       borderwidth=0,
-                       lightcolor=COLORS['accent'],
-                       darkcolor=COLORS['accent'])
-        style.configure('TCombobox',
-                       fieldbackground=COLORS['input_bg'],
-                       background=COLORS['input_bg'],
-                       foreground=COLORS['text_primary'],
-                       borderwidth=2,
-                       relief='flat',
-                       padding=8)
-        style.map('TCombobox',
-                 fieldbackground=[('readonly', COLORS['input_bg'])],
-                 background=[('readonly', COLORS['input_bg'])],
-                 foreground=[('readonly', COLORS['text_primary'])],
-                 bordercolor=[('focus', COLORS['accent']), ('!focus', COLORS['border'])],
-                 lightcolor=[('focus', COLORS['accent'])],
-                 darkcolor=[('focus', COLORS['accent'])])
-        
-        # Recursively update all widgets
-        self._update_widget_tree(self.main_frame)
-    
-    def _update_widget_tree(self, widget):
-        """Recursively update widget colors."""
-        widget_type = widget.winfo_class()
-        
-        # Update frames
-        if widget_type == 'Frame' or widget_type == 'Toplevel':
-            try:
-                widget.configure(bg=COLORS['bg_primary'])
-            except:
-                pass
-        
-        # Update labels
-        elif widget_type == 'Label':
-            try:
-                current_fg = widget.cget('fg')
-                # Preserve secondary text color
-                if current_fg in [COLORS_LIGHT['text_secondary'], COLORS_DARK['text_secondary']]:
-                    widget.configure(bg=COLORS['bg_primary'], fg=COLORS['text_secondary'])
-                elif current_fg in [COLORS_LIGHT['text_tertiary'], COLORS_DARK['text_tertiary']]:
-                    widget.configure(bg=COLORS['bg_primary'], fg=COLORS['text_tertiary'])
-                else:
-                    widget.configure(bg=COLORS['bg_primary'], fg=COLORS['text_primary'])
-            except:
-                pass
-        
-        # Update entries
-        elif widget_type == 'Entry':
-            try:
-                widget.configure(bg=COLORS['input_bg'], fg=COLORS['text_primary'],
-                               insertbackground=COLORS['text_primary'],
-                               highlightcolor=COLORS['accent'],
-                               highlightbackground=COLORS['border'])
-            except:
-                pass
-        
-        # Update text widgets
-        elif widget_type == 'Text' or widget_type == 'ScrolledText':
-            try:
-                current_bg = widget.cget('bg')
-                # Check if it's the log widget (tertiary background)
-                if current_bg in [COLORS_LIGHT['bg_tertiary'], COLORS_DARK['bg_tertiary']]:
-                    widget.configure(bg=COLORS['bg_tertiary'], fg=COLORS['text_primary'],
-                                   insertbackground=COLORS['text_primary'],
-                                   selectbackground=COLORS['accent'],
-                                   selectforeground='white')
-                else:
-                    widget.configure(bg=COLORS['input_bg'], fg=COLORS['text_primary'],
-                                   insertbackground=COLORS['text_primary'],
-                                   selectbackground=COLORS['accent'],
-                                   selectforeground='white')
-            except:
-                pass
-        
-        # Update buttons (but preserve special states)
-        elif widget_type == 'Button':
-            try:
-                current_bg = widget.cget('bg')
-                current_state = widget.cget('state')
-                current_text = widget.cget('text')
-                
-                # Preserve Start button accent color
-                if current_bg in [COLORS_LIGHT['accent'], COLORS_DARK['accent']]:
-                    widget.configure(bg=COLORS['accent'], fg='white',
-                                   activebackground=COLORS['accent_hover'],
-                                   activeforeground='white')
-                # Preserve disabled button styling
-                elif current_state == 'disabled':
-                    if current_bg in [COLORS_LIGHT['bg_tertiary'], COLORS_DARK['bg_tertiary']]:
-                        widget.configure(bg=COLORS['bg_tertiary'], fg=COLORS['text_tertiary'])
-                # Update regular buttons (including theme button)
-                else:
-                    widget.configure(bg=COLORS['button_bg'], fg=COLORS['text_primary'],
-                                   activebackground=COLORS['button_hover'],
-                                   activeforeground=COLORS['text_primary'],
-                                   highlightbackground=COLORS['button_border'])
-            except:
-                pass
-        
-        # Update border containers (frames with border color)
-        try:
-            current_bg = widget.cget('bg')
-            if current_bg in [COLORS_LIGHT['border'], COLORS_DARK['border']]:
-                widget.configure(bg=COLORS['border'])
-        except:
-            pass
-        
-        # Recursively update children
+
+        # Update ttk styles (skipped when this theme is already applied)
+        self._apply_ttk_styles()
+
+        # Unmap the main frame while recoloring so Tk coalesces the
+        # per-widget redraws into the single re-map at the end
+        # (grid_remove remembers the grid options for the re-grid)
+        self.main_frame.grid_remove()
         try:
-            for child in widget.winfo_children():
-                self._update_widget_tree(child)
-        except:
-            pass
+            with self._batch_ui_updates():
+                dead = False
+                for kind, w in self.theme_widgets:
+                    try:
+                        _THEME_APPLY[kind](w)
+                    except tk.TclError:
+                        dead = True  # widget from a closed dialog
+                if dead:
+                    self.theme_widgets = [
+                        (kind, w) for kind, w in self.theme_widgets
+                        if w.winfo_exists()
+                    ]
+        finally:
+            self.main_frame.grid()
     
+    def _update_widget_tree(self, widget):
+        """Recursively update widget colors. Only used for transient
+           Toplevels (Manage Keys); the main window goes through the
+           theme_widgets registry instead."""
+        handler = _WALK_HANDLERS.get(widget.winfo_class())
+        if handler is not None:
+            handler(widget)
+        for child in widget.winfo_children():
+            self._update_widget_tree(child)
+
     def _create_styled_button(self, parent, text, command):
         """Create a styled button matching AIVerse design."""
         btn = tk.Button(parent, text=text, command=command,
-                       bg=COLORS['button_bg'], fg=COLORS['text_primary'],
-                       activebackground=COLORS['button_hover'],
-                       activeforeground=COLORS['text_primary'],
                        relief='flat', bd=0,
                        highlightthickness=2,
                        highlightcolor=COLORS['accent'],
-                       highlightbackground=COLORS['button_border'],
                        padx=14, pady=8,
-                       font=(self.default_font[0], self.default_font[1], 'normal'),
-                       cursor='hand2')
-        return btn
+                       font='AppDefault',
+                       cursor='hand2',
+                       **_active_presets['button'])
+        return self._register('button', btn)
     
     def _add_hover_effect(self, widget, normal_bg, hover_bg):
         """Add hover effect to a widget, preserving text color."""
@@ -966,13 +1496,30 @@ class App:
         if file:
             self.input_file.delete(0, tk.END)
             self.input_file.insert(0, file)
-            try:
-                txt = open(file, 'r', encoding='utf-8').read()
-                self.text_input.delete('1.0', tk.END)
-                self.text_input.insert(tk.END, txt)
-                self.update_count()
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+            # read off the UI thread so a huge file doesn't freeze the GUI
+            threading.Thread(target=self._load_file_async, args=(file,),
+                             daemon=True).start()
+
+    def _load_file_async(self, file):
+        """Worker: read the picked file (capped) and hand it to the UI thread."""
+        try:
+            with open(file, 'r', encoding='utf-8', buffering=1 << 20) as f:
+                txt = f.read(MAX_INPUT_CHARS + 1)
+        except Exception as e:
+            self.root.after(0, functools.partial(messagebox.showerror, "Error", str(e)))
+            return
+        truncated = len(txt) > MAX_INPUT_CHARS
+        if truncated:
+            txt = txt[:MAX_INPUT_CHARS]
+        self.root.after(0, functools.partial(self._set_input_text, txt, truncated))
+
+    def _set_input_text(self, txt, truncated=False):
+        self.text_input.delete('1.0', tk.END)
+        self.text_input.insert(tk.END, txt)
+        self.update_count()
+        if truncated:
+            messagebox.showwarning(
+                "Warning", "File is larger than 5 MB; only the first part was loaded.")
 
     def browse_output(self):
         folder = filedialog.askdirectory()
@@ -981,23 +1528,50 @@ class App:
             self.output_folder.insert(0, folder)
 
     def update_count(self, event=None):
-        txt = self.text_input.get('1.0', 'end-1c')
-        self.count_label.config(text=f"Character count: {len(txt)}")
+        """Debounced: coalesce keystroke bursts into one count refresh."""
+        if self._count_after is not None:
+            self.root.after_cancel(self._count_after)
+        self._count_after = self.root.after(150, self._do_count)
+
+    def _do_count(self):
+        self._count_after = None
+        # count on the Tcl side; get() would copy the whole buffer to Python
+        n = self.text_input.count('1.0', 'end-1c', 'chars') or 0
+        if isinstance(n, tuple):
+            n = n[0]
+        # skip the label reconfigure when the count didn't change
+        # (e.g. arrow-key navigation also fires KeyRelease)
+        if n != self._last_count:
+            self._last_count = n
+            self.count_label.config(text=f"Character count: {n}")
+
+    # rolling log cap: trim back to LOG_KEEP_LINES once LOG_MAX_LINES is
+    # exceeded, so Text inserts stay cheap on long runs
+    LOG_MAX_LINES = 2000
+    LOG_KEEP_LINES = 1500
 
     def log(self, msg):
+        # scroll with the output only if the user hasn't scrolled away
+        at_tail = self.log_widget.yview()[1] > 0.98
         self.log_widget.config(state='normal')
         self.log_widget.insert(tk.END, msg)
-        self.log_widget.see(tk.END)
+        n = int(self.log_widget.index('end-1c').split('.')[0])
+        if n > self.LOG_MAX_LINES:
+            self.log_widget.delete('1.0', f'{n - self.LOG_KEEP_LINES}.0')
+        if at_tail:
+            self.log_widget.see(tk.END)
         self.log_widget.config(state='disabled')
 
-    def poll_queue(self):
-        try:
-            while True:
-                msg = self.queue.get_nowait()
-                self.log(msg)
-        except queue.Empty:
-            pass
-        self.root.after(100, self.poll_queue)
+    def poll_queue(self, event=None):
+        # Drain everything that queued up since the last <<LogMessage>>
+        # and hand it to log() as one string, so a burst of worker output
+        # costs one insert/see round-trip instead of four Tcl calls each.
+        msgs = []
+        q = self.queue
+        while q:
+            msgs.append(q.popleft())
+        if msgs:
+            self.log(''.join(msgs))
 
     def start(self):
         self.start_btn.config(state='disabled', bg=COLORS['text_tertiary'], 
@@ -1010,8 +1584,9 @@ class App:
 
         file_path = self.input_file.get().strip()
         if os.path.isfile(file_path):
-            text = open(file_path, 'r', encoding='utf-8').read()
+            text = None  # read in the worker thread; keeps the event loop free
         else:
+            file_path = None
             text = self.text_input.get('1.0', 'end-1c')
         out_folder = self.output_folder.get().strip()
 
@@ -1022,30 +1597,36 @@ class App:
         if not base:
             base = "untitled"
         os.makedirs(out_folder, exist_ok=True)
-        import sys
-        class QRedirect:
-            def write(slf, txt): self.queue.put(txt)
-
-            def flush(slf): pass
-
-        sys.stdout = sys.stderr = QRedirect()
         vid = self.voice_map.get(self.voice_var.get(), DEFAULT_VOICE_ID)
 
-        self.cancel_requested = False
+        self.cancel_event.clear()
         self.progress["value"] = 0
         self.progress["maximum"] = 1
 
-        threading.Thread(target=self.run, args=(text, out_folder, base, vid), daemon=True).start()
+        threading.Thread(target=self.run,
+                         args=(text, file_path, out_folder, base, vid),
+                         daemon=True).start()
 
-    def run(self, text, out_folder, base, voice_id):
+    def _read_input_file(self, file_path):
+        """Read the input file with a large buffer, capped like the text box."""
+        with open(file_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+            txt = f.read(MAX_INPUT_CHARS + 1)
+        if len(txt) > MAX_INPUT_CHARS:
+            log.warning("Input file is larger than 5 MB; extra text was skipped.\n")
+            txt = txt[:MAX_INPUT_CHARS]
+        return txt
+
+    def run(self, text, file_path, out_folder, base, voice_id):
         try:
+            if text is None:
+                text = self._read_input_file(file_path)
             process_text(
                 text,
                 out_folder,
                 base,
                 voice_id,
                 progress_callback=self.update_progress,
-                cancel_check=lambda: self.cancel_requested
+                cancel_event=self.cancel_event
             )
             messagebox.showinfo("Done", "All files processed successfully!")
         except Exception as e:
@@ -1054,7 +1635,7 @@ class App:
             self.reset()
 
     def reset(self):
-        self.cancel_requested = False
+        self.cancel_event.clear()
         self.input_file.delete(0, tk.END)
         self.base_name.delete(0, tk.END)
         self.text_input.delete('1.0', tk.END)
@@ -1066,7 +1647,7 @@ class App:
         self.progress["value"] = 0
 
     def cancel(self):
-        self.cancel_requested = True
+        self.cancel_event.set()
         self.cancel_btn.config(state='disabled', bg=COLORS['bg_tertiary'], 
                               fg=COLORS['text_tertiary'])
         self.log("Cancellation requested...\n")
@@ -1076,132 +1657,214 @@ class App:
         self.progress["value"] = value
 
     def manage_keys(self):
+        """Show the Manage Keys dialog. The widget tree is built once and
+           reused: closing only withdraws the window, reopening refreshes
+           the text area and deiconifies."""
+        win = getattr(self, 'manage_keys_window', None)
+        if win is not None and win.winfo_exists():
+            self._refresh_manage_keys_text()
+            win.deiconify()
+            win.lift()
+            self._manage_keys_text.focus_set()
+            return
+        self._build_manage_keys_window()
+
+    def _refresh_manage_keys_text(self):
+        """Replace the dialog text with the current key list (one insert)."""
+        text_area = self._manage_keys_text
+        text_area.delete('1.0', tk.END)
+        if API_KEYS:
+            text_area.insert(tk.END, "\n".join(API_KEYS) + "\n")
+            text_area.edit_reset()
+
+    def _build_manage_keys_window(self):
         def save_and_close():
             new_keys = [k.strip() for k in text_area.get('1.0', 'end-1c').splitlines() if k.strip()]
             if not new_keys:
                 messagebox.showwarning("Warning", "Key list cannot be empty.")
                 return
 
-            global API_KEYS, key_usage, char_usage, first_used, invalid_keys, current_key_index
-            API_KEYS = new_keys
-            # reinitialize usage dicts
-            old_usage = key_usage.copy()
-            old_chars = char_usage.copy()
-            old_first = first_used.copy()
-            key_usage.clear()
-            char_usage.clear()
-            first_used.clear()
-            for k in API_KEYS:
-                key_usage[k] = old_usage.get(k, 0)
-                char_usage[k] = old_chars.get(k, 0)
-                if k in old_first:
-                    first_used[k] = old_first[k]
-            invalid_keys &= set(API_KEYS)
-            current_key_index = 0
-
-            # write keys file atomically
-            tmp = KEY_FILE + ".tmp"
-            try:
-                with open(tmp, 'w', encoding='utf-8') as f:
-                    json.dump(API_KEYS, f, indent=2)
-                os.replace(tmp, KEY_FILE)
-            except Exception as e:
-                print("Could not save keys:", e)
-            win.destroy()
+            global API_KEYS, key_usage, char_usage, first_used, invalid_keys
+            with state_lock:
+                if new_keys == API_KEYS:
+                    # nothing changed; skip the state rebuild and file write
+                    win.withdraw()
+                    return
+                API_KEYS = new_keys
+                # reinitialize usage dicts
+                old_usage = key_usage.copy()
+                old_chars = char_usage.copy()
+                old_first = first_used.copy()
+                key_usage.clear()
+                char_usage.clear()
+                first_used.clear()
+                for k in API_KEYS:
+                    key_usage[k] = old_usage.get(k, 0)
+                    char_usage[k] = old_chars.get(k, 0)
+                    if k in old_first:
+                        first_used[k] = old_first[k]
+                invalid_keys &= set(API_KEYS)
+                _rebuild_valid_keys_locked()
 
-        save_keys()
+            save_keys()
+            win.withdraw()
 
         win = tk.Toplevel(self.root)
         win.title("Manage API Keys")
         win.configure(bg=COLORS['bg_primary'])
         win.geometry("600x500")
-        
+        # closing (Cancel or window manager) just hides the dialog so the
+        # widget tree survives for the next open
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
+
         # Store reference for theme updates
         self.manage_keys_window = win
-        
+
         # Main container
         main_container = tk.Frame(win, bg=COLORS['bg_primary'], padx=24, pady=16)
         main_container.pack(fill='both', expand=True)
-        
+
         # Label
         label = tk.Label(main_container, text="Enter one API key per line:",
                 bg=COLORS['bg_primary'], fg=COLORS['text_primary'],
                 font=self.label_font)
         label.pack(anchor='w', pady=(0, 8))
-        
+
         # Text area with styled border
         text_container = tk.Frame(main_container, bg=COLORS['border'], padx=2, pady=2)
         text_container.pack(fill='both', expand=True, pady=(0, 16))
         text_area = scrolledtext.ScrolledText(text_container, width=50, height=15,
                                              relief='flat', bd=0,
-                                             bg=COLORS['input_bg'], fg=COLORS['text_primary'],
-                                             insertbackground=COLORS['text_primary'],
-                                             selectbackground=COLORS['accent'],
-                                             selectforeground='white',
-                                             font=('Consolas', self.default_font[1] - 1),
-                                             wrap=tk.WORD)
+                                             highlightthickness=1,
+                                             font='AppMono',
+                                             wrap=tk.WORD,
+                                             **_active_presets['text'])
         text_area.pack(fill='both', expand=True)
-        for k in API_KEYS:
-            text_area.insert(tk.END, k + "\n")
-        text_area.bind("<FocusIn>", lambda e: text_container.config(bg=COLORS['accent']))
-        text_area.bind("<FocusOut>", lambda e: text_container.config(bg=COLORS['border']))
-        
+        self._manage_keys_text = text_area
+        self._refresh_manage_keys_text()
+
         # Button frame
         btn_frame = tk.Frame(main_container, bg=COLORS['bg_primary'])
         btn_frame.pack(fill='x')
-        self._create_styled_button(btn_frame, "Cancel", win.destroy).pack(side='right', padx=(8, 0))
+        self._create_styled_button(btn_frame, "Cancel", win.withdraw).pack(side='right', padx=(8, 0))
         save_btn = tk.Button(btn_frame, text="Save", command=save_and_close,
-                            bg=COLORS['accent'], fg='white',
-                            activebackground=COLORS['accent_hover'],
-                            activeforeground='white',
-                            relief='flat', bd=0,
-                            padx=20, pady=10,
-                            font=(self.default_font[0], self.default_font[1], 'bold'),
-                            cursor='hand2',
-                            highlightthickness=0)
+                            **ACCENT_BTN_OPTS,
+                            **_active_presets['button_accent'])
         save_btn.pack(side='right')
-        
+
+        # widgets above were built with the current palette
+        self._manage_keys_applied_theme = self._theme_version
+
         # Update manage keys window when theme changes
         def update_manage_keys_theme():
+            if self._manage_keys_applied_theme == self._theme_version:
+                return
             if hasattr(self, 'manage_keys_window') and self.manage_keys_window.winfo_exists():
-                self._update_widget_tree(self.manage_keys_window)
-        
+                with self._batch_ui_updates():
+                    self._update_widget_tree(self.manage_keys_window)
+                self._manage_keys_applied_theme = self._theme_version
+
         # Store update function
         self._update_manage_keys = update_manage_keys_theme
 
+    def _load_cached_voices(self):
+        """Startup worker: parse the on-disk voice cache and hand the
+           result to the UI thread, so first-paint never waits for it."""
+        cached = load_voice_cache()
+        if cached:
+            self._apply_voices(cached.get("voices", []))
+
+    def _maybe_load_voices(self, event=None):
+        """First dropdown interaction: kick off the cache/API refresh once."""
+        if self._voices_loaded:
+            return
+        self._voices_loaded = True
+        threading.Thread(target=self._async_load_voices, daemon=True).start()
+
     def _async_load_voices(self):
-        voices = get_voices(use_cache=True, force_refresh=False)
-        # voices is a list of dicts; map to (name, voice_id)
-        mapping = {}
-        for v in voices:
-            try:
-                mapping[v["name"]] = v.get("voice_id") or v.get("id")  # defensive keys
-            except Exception:
-                continue
-        # ensure Glinda
+        # reuse the finished mapping/sort when the cache file is untouched
+        try:
+            mtime = os.stat(VOICE_CACHE_FILE).st_mtime_ns
+        except OSError:
+            mtime = None
+        memo = self._voices_memo
+        if mtime is not None and mtime == memo["mtime"]:
+            mapping, sorted_voices = memo["result"]
+            self.root.after(0, functools.partial(self._update_voice_menu, mapping, sorted_voices))
+            # the memo only skips the rebuild/sort; a cache past its TTL
+            # still gets revalidated against the API in the background
+            cache = load_voice_cache()
+            if cache and _voice_cache_stale(cache):
+                _refresh_voices_async(self._apply_voices)
+            return
+        voices = get_voices(use_cache=True, force_refresh=False,
+                            on_refresh=self._apply_voices)
+        self._apply_voices(voices)
+
+    def _apply_voices(self, voices):
+        """Map a raw voice list to name->id and sort it, then hand the
+           ready-made tuple to the UI thread. Runs on the worker thread
+           for refreshes, so the mainloop never pays for the dict build
+           or the sort."""
+        mapping = {v["name"]: v.get("voice_id") or v.get("id")
+                   for v in voices if isinstance(v, dict) and "name" in v}
+        # ensure Glinda, pinned first in the dropdown; partition her out
+        # with C-level list ops instead of filtering in a genexp
         mapping.setdefault("Glinda", DEFAULT_VOICE_ID)
+        names = list(mapping)
+        names.remove("Glinda")
+        names.sort()
+        sorted_voices = ("Glinda", *names)
+        # remember the finished tuple against the cache file's mtime so
+        # later refreshes with an untouched cache skip the rebuild
+        try:
+            self._voices_memo["mtime"] = os.stat(VOICE_CACHE_FILE).st_mtime_ns
+        except OSError:
+            self._voices_memo["mtime"] = None
+        self._voices_memo["result"] = (mapping, sorted_voices)
         # schedule GUI update on main thread
-        self.root.after(0, lambda: self._update_voice_menu(mapping))
+        self.root.after(0, functools.partial(self._update_voice_menu, mapping, sorted_voices))
 
-    def _update_voice_menu(self, mapping):
-        """Replace Combobox entries with mapping (name->voice_id)."""
+    def _update_voice_menu(self, mapping, sorted_voices):
+        """Adopt freshly built voice state. Only Python attributes change
+           here; the name list reaches Tcl via postcommand when the
+           dropdown actually opens."""
         self.voice_map = mapping
         # keep previous selection if possible
         current = self.voice_var.get()
-        # Sort voices, putting Glinda first
-        sorted_voices = sorted(mapping.keys(), key=lambda n: (n != "Glinda", n))
-        self.voice_menu['values'] = sorted_voices
+        self._voice_names = sorted_voices
         # restore selection or set to Glinda
         if current in mapping:
             self.voice_var.set(current)
         else:
             self.voice_var.set("Glinda")
 
+    def _populate_voice_menu(self):
+        """postcommand hook: push the voice names into the Combobox right
+           before the dropdown posts, and only when they changed since the
+           last push."""
+        if self._voice_names != self._voice_values_pushed:
+            self.voice_menu['values'] = self._voice_names
+            self._voice_values_pushed = self._voice_names
+
 
 if __name__ == "__main__":
-    load_config()
-    load_keys()
-    load_state()
+    # Overlap the startup file reads with Tk interpreter creation; the
+    # loaders serialize on state_lock where they touch shared dicts, and
+    # the join below guarantees App sees fully loaded state. The config
+    # must land before load_state runs: reset_expired_keys at its end
+    # reads the configured update_interval_days and char_limit, and the
+    # defaults could wrongly reset a window or invalidate a key.
+    def _load_config_then_state():
+        load_config()
+        load_state()
+
+    loaders = [threading.Thread(target=fn, daemon=True)
+               for fn in (_load_config_then_state, load_keys)]
+    for t in loaders:
+        t.start()
     root = tk.Tk()
+    for t in loaders:
+        t.join()
     app = App(root)
     root.mainloop()